@@ -2,22 +2,44 @@ import subprocess
 import sys
 import os
 import json
-import tempfile
 import argparse
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import orjson
 from rich.console import Console
-from jsonschema import validate, ValidationError
+from rich.text import Text
+import fastjsonschema
+import jsonschema
 
 console = Console()
 
 GO_SOURCE_FILE = "jisp.go"
 BINARY_NAME = "bin-jisp"
+FINGERPRINT_FILE = BINARY_NAME + ".fingerprint"
+CHECK_CACHE_FILE = ".check_cache.json"
 CHECKS_DIR = "checks"
 
+# --- ANSI colors for hot-path output ---
+# Skip/summary lines fire once per check on bad suites; writing them with
+# pre-computed escape codes avoids Rich's markup parse + style resolution
+# per call. `console` is kept for the structured failure reports where
+# markup is worth the cost.
+_RED = "\x1b[1;31m"
+_GREEN = "\x1b[1;32m"
+_YELLOW = "\x1b[1;33m"
+_BLUE = "\x1b[1;34m"
+_RESET = "\x1b[0m"
+
 # --- Error Message Constants ---
-GO_COMPILATION_FAILED = "[bold red]❌ Go compilation failed.[/bold red]"
-GO_COMMAND_NOT_FOUND = "[bold red]❌ Go command not found. Install Go or check PATH.[/bold red]"
-CHECKS_DIR_NOT_FOUND = "[bold red]❌ Checks directory '{CHECKS_DIR}' not found.[/bold red]"
-NO_CHECK_FILES_FOUND = "[bold yellow]⚠️ No check files found in '{CHECKS_DIR}'.[/bold yellow]"
+# The fully static messages are rendered by Rich once here, so printing
+# them later skips the markup parse entirely. Messages with run-time
+# dynamic parts keep the template form.
+GO_COMPILATION_FAILED = Text.from_markup("[bold red]❌ Go compilation failed.[/bold red]")
+GO_COMMAND_NOT_FOUND = Text.from_markup("[bold red]❌ Go command not found. Install Go or check PATH.[/bold red]")
+CHECKS_DIR_NOT_FOUND = Text.from_markup(f"[bold red]❌ Checks directory '{CHECKS_DIR}' not found.[/bold red]")
+NO_CHECK_FILES_FOUND = Text.from_markup(f"[bold yellow]⚠️ No check files found in '{CHECKS_DIR}'.[/bold yellow]")
 ERROR_READING_CHECKS_DIR = "[bold red]❌ Error reading checks directory '{CHECKS_DIR}': {e}.[/bold red]"
 JSON_DECODE_ERROR_IN_FILE = "  [bold red]❌ Error decoding JSON in {filepath}: {e}.[/bold red]"
 
@@ -31,13 +53,13 @@ TEST_FAILED_INVALID_JISP_JSON = "Invalid JSON output from JISP binary: {}"
 TEST_FAILED_VALIDATION_ERROR = "Validation error."
 
 # Skipping messages
-SKIPPING_TEST_MISSING_PROGRAM = "[bold yellow]⚠️ Skipping test '{description}' in {filepath}: Missing 'jisp_program'.[/bold yellow]"
-SKIPPING_TEST_MISSING_SCHEMA_OR_ERROR = "[bold yellow]⚠️ Skipping test '{description}' in {filepath}: Missing 'validation_schema', 'expected_stack'/'expected_variables', or 'expected_error_message'.[/bold yellow]"
+SKIPPING_TEST_MISSING_PROGRAM = f"{_YELLOW}⚠️ Skipping test '{{description}}' in {{filepath}}: Missing 'jisp_program'.{_RESET}\n"
+SKIPPING_TEST_MISSING_SCHEMA_OR_ERROR = f"{_YELLOW}⚠️ Skipping test '{{description}}' in {{filepath}}: Missing 'validation_schema', 'expected_stack'/'expected_variables', or 'expected_error_message'.{_RESET}\n"
 
 # Final summary messages
-ALL_TESTS_PASSED = "[bold green]All {passed_tests} tests passed successfully![/bold green]"
-TEST_SUMMARY = "[bold red]❌ {passed_tests}/{total_tests} tests passed.[/bold red]"
-COMPILATION_FAILED = "[bold red]❌ Compilation failed.[/bold red]"
+ALL_TESTS_PASSED = f"{_GREEN}All {{passed_tests}} tests passed successfully!{_RESET}\n"
+TEST_SUMMARY = f"{_RED}❌ {{passed_tests}}/{{total_tests}} tests passed.{_RESET}\n"
+COMPILATION_FAILED = Text.from_markup("[bold red]❌ Compilation failed.[/bold red]")
 # --- End Error Message Constants ---
 
 class _TestFailureException(Exception):
@@ -45,57 +67,206 @@ class _TestFailureException(Exception):
     pass
 
 def _handle_test_failure(fail_fast, description, checks_filepath, message, details=None):
-    """Prints failure details and raises an exception if fail-fast is on."""
-    _print_test_failure(description, checks_filepath, message)
-    if details:
-        for key, value in details.items():
-            console.print(f"    {key}: {value}")
+    """Prints one assembled failure report and raises if fail-fast is on."""
+    sys.stdout.write(_format_test_failure(description, checks_filepath, message, details))
     if fail_fast:
         raise _TestFailureException()
 
-def _print_test_failure(description: str, checks_filepath: str, message: str):
-    """Helper to print a formatted test failure message."""
-    console.print(f"  [bold red]❌ Test '{description}'\n[bold blue]{checks_filepath}[/bold blue] {message}[/bold red]")
+def _format_test_failure(description: str, checks_filepath: str, message: str, details=None):
+    """Assembles a complete failure report as a single string.
 
+    One string means one write and one flush per failure instead of a
+    cascade of prints, and keeps each report atomic in the output.
+    """
+    lines = [f"  {_RED}❌ Test '{description}'\n{_BLUE}{checks_filepath}{_RESET} {_RED}{message}{_RESET}"]
+    if details:
+        lines.extend(f"    {key}: {value}" for key, value in details.items())
+    return "\n".join(lines) + "\n"
+
+
+def _uses_draft2020(schema):
+    """True when a schema relies on JSON Schema 2020-12 vocabulary.
+
+    fastjsonschema implements drafts 04/06/07 only, while a $schema-less
+    schema under jsonschema.validate resolves as 2020-12 — where tuple
+    validation is spelled prefixItems, with boolean `items` as the closing
+    rule. Compiling such a schema with fastjsonschema silently changes its
+    meaning (draft-07 `items: false` forbids every element), so these are
+    detected and kept on the 2020-12 engine.
+    """
+    if isinstance(schema, dict):
+        if "prefixItems" in schema or "2020-12" in str(schema.get("$schema", "")):
+            return True
+        return any(_uses_draft2020(value) for value in schema.values())
+    if isinstance(schema, list):
+        return any(_uses_draft2020(value) for value in schema)
+    return False
 
-def _merge_schemas(base, new):
-    """Recursively merges the 'new' schema into the 'base' schema."""
-    if not isinstance(base, dict) or not isinstance(new, dict):
-        return new
-    
-    merged = base.copy()
-    for key, new_val in new.items():
-        if key in merged:
-            merged[key] = _merge_schemas(merged[key], new_val)
-        else:
-            merged[key] = new_val
-    return merged
+def _mk_draft2020_validator(schema):
+    """Wraps a Draft202012Validator in the fastjsonschema call contract.
+
+    Validation errors are re-raised as JsonSchemaValueException carrying
+    equivalent message/path/definition fields, so _evaluate_response
+    reports both engines identically. The validator object is built once
+    here and cached by _compiled_validator like any compiled schema.
+    """
+    checker = jsonschema.Draft202012Validator(schema)
+
+    def _validate(state):
+        try:
+            checker.validate(state)
+        except jsonschema.ValidationError as e:
+            name = ".".join(["data", *map(str, e.absolute_path)])
+            definition = {e.validator: e.validator_value} if e.validator else None
+            raise fastjsonschema.JsonSchemaValueException(
+                e.message, value=e.instance, name=name,
+                definition=definition, rule=e.validator) from None
+
+    return _validate
+
+@functools.lru_cache(maxsize=None)
+def _compiled_validator(schema_bytes):
+    """Compiles a canonical schema's JSON bytes into a specialized validator.
+
+    fastjsonschema code-generates a closure per schema, so checks that share
+    a schema pay compilation once per run instead of a full interpretive
+    walk of the schema tree per validation. Schemas that need 2020-12
+    semantics fall back to a cached jsonschema validator instead.
+    """
+    schema = orjson.loads(schema_bytes)
+    if _uses_draft2020(schema):
+        return _mk_draft2020_validator(schema)
+    return fastjsonschema.compile(schema)
+
+_schema_pool = {}
+_validator_by_id = {}
+
+def _intern_schema(schema):
+    """Collapses structurally identical schemas onto one shared dict.
+
+    Check files reuse the same validation_schema across dozens of tests;
+    interning by canonical-JSON digest means duplicates share a single
+    Python object, so validators can be looked up by identity.
+    """
+    if schema is None:
+        return None
+    key = hashlib.blake2b(orjson.dumps(schema, option=orjson.OPT_SORT_KEYS), digest_size=16).digest()
+    return _schema_pool.setdefault(key, schema)
+
+def _validator_for(schema):
+    """Returns the compiled validator for an interned schema, keyed by id()."""
+    try:
+        return _validator_by_id[id(schema)]
+    except KeyError:
+        validator = _compiled_validator(orjson.dumps(schema, option=orjson.OPT_SORT_KEYS))
+        _validator_by_id[id(schema)] = validator
+        return validator
+
+@functools.lru_cache(maxsize=None)
+def _mk_err_checker(expected):
+    """Generates a response checker specialized to one expected substring.
+
+    The substring is baked into the generated code object as a constant, so
+    the hot call is a single `in` test with no closure-cell or dict lookups.
+    The source string is kept on the function for failure diagnostics.
+    """
+    namespace = {}
+    exec(f"def _check(state):\n"
+         f"    error = state.get('error')\n"
+         f"    return error is not None and {expected!r} in error.get('message', '')",
+         namespace)
+    checker = namespace["_check"]
+    checker.expected = expected
+    return checker
+
+def _mk_equality_validator(check):
+    """Direct-equality judge for shorthand-only checks.
+
+    Most checks state their expectation purely through `expected_stack` /
+    `expected_variables`, which the schema path turns into `const` rules.
+    Plain Python comparisons decide those without compiling or running a
+    validator; mismatches raise JsonSchemaValueException carrying the same
+    message/path/definition fields the compiled path produces, so failure
+    reports are indistinguishable between the two.
+    """
+    expected_stack = check.get("expected_stack")
+    has_expected_stack = "expected_stack" in check
+    expected_variables = check.get("expected_variables", {})
+
+    def _validate(state):
+        if "stack" not in state or "variables" not in state:
+            raise fastjsonschema.JsonSchemaValueException(
+                "data must contain ['stack', 'variables'] properties",
+                value=state, name="data",
+                definition={"required": ["stack", "variables"]}, rule="required")
+        stack = state["stack"]
+        if has_expected_stack:
+            if stack != expected_stack:
+                raise fastjsonschema.JsonSchemaValueException(
+                    "data.stack must be same as const definition",
+                    value=stack, name="data.stack",
+                    definition={"const": expected_stack}, rule="const")
+        elif stack:
+            raise fastjsonschema.JsonSchemaValueException(
+                "data.stack must contain less than or equal to 0 items",
+                value=stack, name="data.stack",
+                definition={"maxItems": 0}, rule="maxItems")
+        variables = state["variables"]
+        for key, value in expected_variables.items():
+            if key not in variables:
+                raise fastjsonschema.JsonSchemaValueException(
+                    f"data.variables must contain ['{key}'] properties",
+                    value=variables, name="data.variables",
+                    definition={"required": [key]}, rule="required")
+            if variables[key] != value:
+                raise fastjsonschema.JsonSchemaValueException(
+                    f"data.variables.{key} must be same as const definition",
+                    value=variables[key], name=f"data.variables.{key}",
+                    definition={"const": value}, rule="const")
+
+    return _validate
 
 def _combine_schemas(check):
     base_schema = check.get("validation_schema")
-    # Make a deep copy to avoid side effects
-    schema = json.loads(json.dumps(base_schema)) if base_schema else {}
+
+    # Fast path: no shorthands to merge, and the user schema already has
+    # everything the defaults below would add (a type, a stack rule, and
+    # the required keys) — return it untouched with zero allocation. The
+    # shared object also guarantees an interning hit.
+    if base_schema and "expected_stack" not in check and "expected_variables" not in check:
+        properties = base_schema.get("properties")
+        required = base_schema.get("required", ())
+        if (properties is not None and "stack" in properties
+                and "type" in base_schema
+                and "stack" in required and "variables" in required):
+            return base_schema
+
+    # Copy-on-write: only the containers this function writes to (the top
+    # level, 'properties', and 'variables') are shallow-copied; untouched
+    # subtrees stay shared with the user's schema, so the per-check cost is
+    # O(touched keys) instead of O(schema size).
+    schema = dict(base_schema) if base_schema else {}
 
     # Ensure basic structure
     schema.setdefault("type", "object")
-    properties = schema.setdefault("properties", {})
+    properties = schema["properties"] = dict(schema.get("properties", {}))
 
     # Handle expected_stack (replaces any existing stack rule)
     if "expected_stack" in check:
         properties["stack"] = {"const": check["expected_stack"]}
-    
+
     # Handle expected_variables (merges with existing variables rules)
     if "expected_variables" in check:
-        variables_schema = properties.setdefault("variables", {})
+        variables_schema = properties["variables"] = dict(properties.get("variables", {}))
         variables_schema.setdefault("type", "object")
-        
+
         # Merge properties from expected_variables
-        variable_props = variables_schema.setdefault("properties", {})
+        variable_props = variables_schema["properties"] = dict(variables_schema.get("properties", {}))
         for key, value in check["expected_variables"].items():
             variable_props[key] = {"const": value}
-            
+
         # Merge required keys from expected_variables
-        variable_req = variables_schema.setdefault("required", [])
+        variable_req = variables_schema["required"] = list(variables_schema.get("required", []))
         for key in check["expected_variables"]:
             if key not in variable_req:
                 variable_req.append(key)
@@ -103,25 +274,96 @@ def _combine_schemas(check):
     # If no schema existed and no shorthands were provided, return None
     if not base_schema and "expected_stack" not in check and "expected_variables" not in check:
         return None
-        
+
     # Apply defaults if sections are missing
     if "stack" not in properties:
         properties["stack"] = {"type": "array", "maxItems": 0}
 
     # Ensure top-level required fields
-    required = schema.setdefault("required", [])
+    required = schema["required"] = list(schema.get("required", []))
     if "stack" not in required: required.append("stack")
     if "variables" not in required: required.append("variables")
 
     return schema
 
+def _src_fingerprint():
+    """SHA-256 of the Go source plus the toolchain version string.
+
+    Content-based, so the rebuild decision survives git checkouts, CI cache
+    restores, and rsync — none of which preserve mtimes.
+    """
+    h = hashlib.sha256()
+    with open(GO_SOURCE_FILE, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    h.update(subprocess.check_output(["go", "version"], close_fds=False))
+    return h.hexdigest()
+
+def _fingerprint_matches():
+    """mtime+hash hybrid staleness check for the compiled binary.
+
+    An unchanged source mtime short-circuits to a single stat; only a
+    changed mtime falls back to hashing, and a hash match (e.g. an editor
+    touch or checkout that rewrote identical bytes) refreshes the stored
+    mtime so the next run takes the fast path again.
+    """
+    try:
+        with open(FINGERPRINT_FILE, 'r') as f:
+            stored_mtime, stored_hash = f.read().split()
+        if os.stat(GO_SOURCE_FILE).st_mtime_ns == int(stored_mtime):
+            return True
+        if stored_hash == _src_fingerprint():
+            _store_fingerprint()
+            return True
+        return False
+    except (OSError, ValueError, subprocess.CalledProcessError):
+        return False
+
+def _store_fingerprint():
+    temp_path = FINGERPRINT_FILE + ".tmp"
+    with open(temp_path, 'w') as f:
+        f.write(f"{os.stat(GO_SOURCE_FILE).st_mtime_ns} {_src_fingerprint()}")
+    os.replace(temp_path, FINGERPRINT_FILE)
+
+def _sha256_file(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def _load_check_cache(use_cache):
+    """Loads the pass-memo for previously seen (binary, check) pairs.
+
+    Keys are hashes over the binary contents and the full canonical check
+    object, so editing the Go source, a program, or its expectations all
+    invalidate the entry automatically.
+    """
+    if not use_cache:
+        return {}
+    try:
+        with open(CHECK_CACHE_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+def _store_check_cache(cache):
+    temp_path = CHECK_CACHE_FILE + ".tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(cache, f)
+    os.replace(temp_path, CHECK_CACHE_FILE)
+
+def _check_cache_key(bin_hash, check):
+    canonical = json.dumps(check, sort_keys=True)
+    return hashlib.sha256((bin_hash + canonical).encode()).hexdigest()
+
 def compile_go_program():
-    if os.path.exists(BINARY_NAME) and os.path.getmtime(GO_SOURCE_FILE) < os.path.getmtime(BINARY_NAME):
+    if os.path.exists(BINARY_NAME) and _fingerprint_matches():
         return True
 
     format_command = ["gofmt", "-w", GO_SOURCE_FILE]
     try:
-        process = subprocess.run(format_command, check=True, capture_output=True, text=True)
+        process = subprocess.run(format_command, check=True, capture_output=True, text=True, close_fds=False)
         if process.stdout.strip():
             console.print(f"Formatted {GO_SOURCE_FILE}")
     except subprocess.CalledProcessError as e:
@@ -133,9 +375,16 @@ def compile_go_program():
         return False
 
 
-    compile_command = ["go", "build", "-o", BINARY_NAME, GO_SOURCE_FILE]
+    # A repo-local GOCACHE survives CI runners that wipe /tmp, and stripping
+    # debug info (-s -w) cuts the link stage and shrinks the binary every
+    # test spawn has to fault in.
+    compile_env = {**os.environ, "GOCACHE": os.path.abspath(".gocache"), "GOFLAGS": "-trimpath"}
+    compile_command = ["go", "build", "-ldflags=-s -w", "-o", BINARY_NAME, GO_SOURCE_FILE]
     try:
-        subprocess.run(compile_command, check=True, capture_output=True, text=True)
+        subprocess.run(compile_command, check=True, capture_output=True, text=True, env=compile_env, close_fds=False)
+        # Fingerprint the post-gofmt source so the next run's comparison
+        # sees the same bytes that were actually compiled.
+        _store_fingerprint()
         return True
     except subprocess.CalledProcessError as e:
         console.print(GO_COMPILATION_FAILED)
@@ -145,122 +394,305 @@ def compile_go_program():
         console.print(GO_COMMAND_NOT_FOUND)
         return False
 
-def run_all_checks(fail_fast=False):
+def _prepare_check(check):
+    """Precomputes the judging artifacts for one check.
+
+    Runs in the loader pool, so schema combining, interning, validator
+    compilation, and error-checker generation all overlap the Go build
+    instead of serializing in front of worker launch. Returns
+    (err_checker, validator, prepare_error); expected-error checks never
+    validate a schema, matching the single-file behavior, and
+    shorthand-only checks get the direct-equality judge instead of a
+    compiled schema. A check that cannot be prepared (e.g. a malformed
+    validation_schema) must not take the whole run down from the loader
+    pool, so the exception is captured and reported as that one check's
+    failure at dispatch time.
+    """
+    try:
+        expected_error_message = check.get("expected_error_message")
+        if expected_error_message:
+            return _mk_err_checker(expected_error_message), None, None
+        if "validation_schema" not in check:
+            if "expected_stack" in check or "expected_variables" in check:
+                return None, _mk_equality_validator(check), None
+            return None, None, None
+        validation_schema = _intern_schema(_combine_schemas(check))
+        if validation_schema is None:
+            return None, None, None
+        return None, _validator_for(validation_schema), None
+    except Exception as e:
+        return None, None, e
+
+def _load_check_file(checks_filepath):
+    """Reads, parses, and prepares one check file in a loader thread.
+
+    Returns (path, check_list, prepared, decode_error) with a single-check
+    file already normalized to a one-element list, so consumers never
+    re-probe the shape. Both read() and orjson release the GIL, so a small
+    thread pool overlaps disk wait on one file with decoding of the others.
+    """
+    try:
+        with open(checks_filepath, 'rb') as f:
+            checks = orjson.loads(f.read())
+    except orjson.JSONDecodeError as e:
+        return checks_filepath, None, None, e
+    check_list = checks if isinstance(checks, list) else [checks]
+    return checks_filepath, check_list, [_prepare_check(c) for c in check_list], None
+
+def _scan_and_load_checks():
+    """Scans CHECKS_DIR and parses every check file via the loader pool.
+
+    Returns (check_paths, parsed, scan_error). Submitted from __main__
+    before go build starts, so directory readahead and JSON parsing run
+    while the compiler does.
+    """
+    try:
+        with os.scandir(CHECKS_DIR) as entries:
+            check_paths = sorted(entry.path for entry in entries
+                                 if entry.name.endswith('.json') and entry.is_file(follow_symlinks=False))
+    except OSError as e:
+        return None, None, e
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        parsed = list(executor.map(_load_check_file, check_paths))
+    return check_paths, parsed, None
+
+# Per-response buffer cap for stream workers. asyncio's default StreamReader
+# limit is 64 KiB, which a single program state with history can exceed;
+# readline() would then raise instead of returning the response.
+_STREAM_LIMIT = 1 << 24
+
+async def _start_stream_worker():
+    """Launches one long-lived `--stream` instance of the JISP binary."""
+    # close_fds=False lets CPython use posix_spawn (vfork underneath)
+    # instead of fork+exec, skipping the page-table copy of the driver's
+    # heap. Python-created fds are CLOEXEC (PEP 446), so nothing leaks.
+    return await asyncio.create_subprocess_exec(
+        f"./{BINARY_NAME}", "--stream",
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        limit=_STREAM_LIMIT,
+        close_fds=False)
+
+async def _run_batch(batch, abort=None):
+    """Runs a slice of checks through one stream worker, pipelined.
+
+    Every request in the slice is written up front and the responses are
+    read back in order, so a slice costs one worker launch and one
+    submission instead of a write/flush round trip per check. If the
+    worker dies, the check whose response never arrived is failed with the
+    worker's stderr and the rest of the slice is resubmitted to a fresh
+    worker, so one crashing program cannot take down its neighbours.
+
+    Under fail-fast, `abort` is an event set on the first failing result;
+    every batch stops judging after its in-flight response, its worker is
+    killed, and the slice's unreached checks yield None (not run).
+    """
+    results = []
+    pending = list(batch)
+    process = await _start_stream_worker()
+    try:
+        while pending and not (abort is not None and abort.is_set()):
+            # Payloads are newline-terminated at serialization time, so the
+            # whole slice is submitted by reference — no concatenated copy.
+            process.stdin.writelines(payload for _, _, payload, _, _ in pending)
+            crashed_index = None
+            for index, (checks_filepath, description, payload, err_checker, validator) in enumerate(pending):
+                if abort is not None and abort.is_set():
+                    break
+                line = await process.stdout.readline()
+                if not line:
+                    crashed_index = index
+                    break
+                result = _evaluate_response(err_checker, validator, line)
+                results.append(result)
+                if abort is not None and not result[0]:
+                    abort.set()
+            if crashed_index is None:
+                pending = []
+            else:
+                stderr = (await process.communicate())[1]
+                results.append((False, (TEST_FAILED_JISP_EXEC_ERROR, {"Stderr": stderr.decode(errors="replace").strip(), "Stdout": ""})))
+                if abort is not None:
+                    abort.set()
+                pending = pending[crashed_index + 1:]
+                process = await _start_stream_worker()
+    finally:
+        if abort is not None and abort.is_set():
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+        else:
+            process.stdin.close()
+        await process.wait()
+    results.extend([None] * (len(batch) - len(results)))
+    return results
+
+def _evaluate_response(err_checker, validator, line):
+    """Judges one stream response line and returns (passed, failure).
+
+    `failure` is None on success, otherwise a (message, details) tuple the
+    main thread can hand to `_handle_test_failure` — workers never print, so
+    output is not interleaved across tasks. The stream protocol reports
+    program failure via the "error" field of the response state, which
+    mirrors the exit-code contract of the single-file mode. `err_checker`
+    and `validator` are pre-built at load time, so no schema or expectation
+    work happens here.
+    """
+    # The response stays as bytes on the hot path; it is only decoded to
+    # str in the cold failure-reporting branches.
+    try:
+        program_state = orjson.loads(line)
+    except orjson.JSONDecodeError as e:
+        if err_checker is not None:
+            return False, (TEST_FAILED_EXPECTED_JSON, {"Stdout": line.decode(errors="replace").strip()})
+        return False, (TEST_FAILED_INVALID_JISP_JSON.format(e), {"JISP Output": line.decode(errors="replace").strip()})
+
+    if err_checker is not None:
+        try:
+            matched = err_checker(program_state)
+        except Exception as e:
+            return False, (TEST_FAILED_UNEXPECTED_EXEC_ERROR.format(e), None)
+        if matched:
+            return True, None
+
+        error_details = program_state.get("error")
+        if error_details is None:
+            return False, (TEST_FAILED_EXPECTED_ERROR, {"Stdout": line.decode(errors="replace").strip()})
+        details = {
+            "Expected to find": f"'{err_checker.expected}'",
+            "Actual message":   f"'{error_details.get('message', '')}'",
+            "Full stdout": line.decode(errors="replace").strip()
+        }
+        return False, (TEST_FAILED_MSG_MISMATCH, details)
+    else:
+        error_details = program_state.get("error")
+        if error_details is not None:
+            return False, (TEST_FAILED_JISP_EXEC_ERROR, {"Error": error_details.get("message", ""), "Stdout": line.decode(errors="replace").strip()})
+        try:
+            validator(program_state)
+            return True, None
+        except fastjsonschema.JsonSchemaException as e:
+            details = {
+                "Error": e.message,
+                "Path": list(e.path),
+                "Expected": e.rule_definition,
+                "Actual State": orjson.dumps(program_state, option=orjson.OPT_INDENT_2).decode()
+            }
+            return False, (TEST_FAILED_VALIDATION_ERROR, details)
+        except Exception as e:
+            return False, (TEST_FAILED_UNEXPECTED_EXEC_ERROR.format(e), None)
+
+async def run_all_checks(fail_fast=False, use_cache=True, preloaded=None):
     total_tests = 0
     passed_tests = 0
 
     if not os.path.isdir(CHECKS_DIR):
-        console.print(CHECKS_DIR_NOT_FOUND.format(CHECKS_DIR=CHECKS_DIR))
+        console.print(CHECKS_DIR_NOT_FOUND)
         return False
 
-    try:
-        check_files = sorted([f for f in os.listdir(CHECKS_DIR) if f.endswith('.json')])
-    except OSError as e:
-        console.print(ERROR_READING_CHECKS_DIR.format(CHECKS_DIR=CHECKS_DIR, e=e))
+    check_paths, parsed, scan_error = preloaded if preloaded is not None else _scan_and_load_checks()
+    if scan_error is not None:
+        console.print(ERROR_READING_CHECKS_DIR.format(CHECKS_DIR=CHECKS_DIR, e=scan_error))
         return False
 
-    if not check_files:
-        console.print(NO_CHECK_FILES_FOUND.format(CHECKS_DIR=CHECKS_DIR))
+    if not check_paths:
+        console.print(NO_CHECK_FILES_FOUND)
         return True
 
+    bin_hash = _sha256_file(BINARY_NAME)
+    cache = _load_check_cache(use_cache)
+
+    tasks = []
+    cache_keys = []
     try:
-        for checks_filename in check_files:
-            checks_filepath = os.path.join(CHECKS_DIR, checks_filename)
-            try:
-                with open(checks_filepath, 'r') as f:
-                    checks = json.load(f)
-            except json.JSONDecodeError as e:
-                console.print(JSON_DECODE_ERROR_IN_FILE.format(filepath=checks_filepath, e=e))
+        for checks_filepath, check_list, prepared, load_error in parsed:
+            if load_error is not None:
+                console.print(JSON_DECODE_ERROR_IN_FILE.format(filepath=checks_filepath, e=load_error))
                 if fail_fast:
                     return False
                 continue
 
-            for i, check in enumerate(checks if isinstance(checks, list) else [checks]):
+            for i, (check, (err_checker, validator, prepare_error)) in enumerate(zip(check_list, prepared)):
                 total_tests += 1
                 description = check.get("description", f"Unnamed test {i+1}")
-                jisp_program = check.get("jisp_program")
-                validation_schema = _combine_schemas(check)
-                expected_error_message = check.get("expected_error_message")
 
-                if not jisp_program:
-                    console.print(SKIPPING_TEST_MISSING_PROGRAM.format(description=description, filepath=checks_filepath))
+                if not check.get("jisp_program"):
+                    sys.stdout.write(SKIPPING_TEST_MISSING_PROGRAM.format(description=description, filepath=checks_filepath))
+                    continue
+
+                if prepare_error is not None:
+                    _handle_test_failure(fail_fast, description, checks_filepath,
+                                         TEST_FAILED_UNEXPECTED_EXEC_ERROR.format(prepare_error))
                     continue
 
-                if not validation_schema and not expected_error_message:
-                    console.print(SKIPPING_TEST_MISSING_SCHEMA_OR_ERROR.format(description=description, filepath=checks_filepath))
+                if err_checker is None and validator is None:
+                    sys.stdout.write(SKIPPING_TEST_MISSING_SCHEMA_OR_ERROR.format(description=description, filepath=checks_filepath))
                     continue
 
-                temp_prog_filepath = None
-                try:
-                    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix=".json") as temp_f:
-                        json.dump(jisp_program, temp_f)
-                        temp_prog_filepath = temp_f.name
-
-                    run_command = [f"./{BINARY_NAME}", temp_prog_filepath]
-
-                    if expected_error_message:
-                        try:
-                            process = subprocess.run(run_command, capture_output=True, text=True)
-                            if process.returncode == 0:
-                                _handle_test_failure(fail_fast, description, checks_filepath, TEST_FAILED_EXPECTED_ERROR, {"Stdout": process.stdout.strip()})
-                                continue
-
-                            try:
-                                output_json = json.loads(process.stdout)
-                                error_details = output_json.get("error", {})
-                                actual_message = error_details.get("message", "")
-                                if expected_error_message in actual_message:
-                                    passed_tests += 1
-                                else:
-                                    details = {
-                                        "Expected to find": f"'{expected_error_message}'",
-                                        "Actual message":   f"'{actual_message}'",
-                                        "Full stdout": process.stdout.strip()
-                                    }
-                                    _handle_test_failure(fail_fast, description, checks_filepath, TEST_FAILED_MSG_MISMATCH, details)
-                            except json.JSONDecodeError:
-                                _handle_test_failure(fail_fast, description, checks_filepath, TEST_FAILED_EXPECTED_JSON, {"Stdout": process.stdout.strip()})
-                        except Exception as e:
-                            _handle_test_failure(fail_fast, description, checks_filepath, TEST_FAILED_UNEXPECTED_EXEC_ERROR.format(e))
-                    else:
-                        try:
-                            process = subprocess.run(run_command, capture_output=True, text=True, check=True)
-                            program_state = json.loads(process.stdout)
-                            validate(instance=program_state, schema=validation_schema)
-                            passed_tests += 1
-                        except subprocess.CalledProcessError as e:
-                            _handle_test_failure(fail_fast, description, checks_filepath, TEST_FAILED_JISP_EXEC_ERROR, {"Stderr": e.stderr.strip(), "Stdout": e.stdout.strip()})
-                        except json.JSONDecodeError as e:
-                            _handle_test_failure(fail_fast, description, checks_filepath, TEST_FAILED_INVALID_JISP_JSON.format(e), {"JISP Output": process.stdout.strip()})
-                        except ValidationError as e:
-                            details = {
-                                "Error": e.message,
-                                "Path": list(e.path),
-                                "Expected": e.schema,
-                                "Actual State": json.dumps(program_state, indent=2)
-                            }
-                            _handle_test_failure(fail_fast, description, checks_filepath, TEST_FAILED_VALIDATION_ERROR, details)
-                        except Exception as e:
-                            _handle_test_failure(fail_fast, description, checks_filepath, TEST_FAILED_UNEXPECTED_EXEC_ERROR.format(e))
-                finally:
-                    if temp_prog_filepath and os.path.exists(temp_prog_filepath):
-                        os.remove(temp_prog_filepath)
+                key = _check_cache_key(bin_hash, check)
+                if cache.get(key) == "pass":
+                    passed_tests += 1
+                    continue
+
+                # The payload is serialized once here; crash resubmission
+                # reuses the same bytes.
+                tasks.append((checks_filepath, description, orjson.dumps(check["jisp_program"]) + b"\n",
+                              err_checker, validator))
+                cache_keys.append(key)
+
+        worker_count = min(os.cpu_count(), len(tasks)) or 1
+        abort = asyncio.Event() if fail_fast else None
+        batches = [tasks[offset::worker_count] for offset in range(worker_count)]
+        batch_results = await asyncio.gather(*(_run_batch(batch, abort) for batch in batches))
+
+        # Re-interleave the strided slices back into submission order.
+        results = [None] * len(tasks)
+        for offset, batch_result in enumerate(batch_results):
+            results[offset::worker_count] = batch_result
+
+        # Record fresh passes before any fail-fast exit so they are not
+        # re-run next time. A None result means the check was aborted
+        # before it ran.
+        for key, result in zip(cache_keys, results):
+            if result is not None and result[0]:
+                cache[key] = "pass"
+        _store_check_cache(cache)
+
+        for (checks_filepath, description, payload, err_checker, validator), result in zip(tasks, results):
+            if result is None:
+                continue
+            passed, failure = result
+            if passed:
+                passed_tests += 1
+            else:
+                message, details = failure
+                _handle_test_failure(fail_fast, description, checks_filepath, message, details)
     except _TestFailureException:
         return False
 
     if passed_tests == total_tests and total_tests > 0:
-        console.print(ALL_TESTS_PASSED.format(passed_tests=passed_tests))
+        sys.stdout.write(ALL_TESTS_PASSED.format(passed_tests=passed_tests))
         return True
-    console.print(TEST_SUMMARY.format(passed_tests=passed_tests, total_tests=total_tests))
+    sys.stdout.write(TEST_SUMMARY.format(passed_tests=passed_tests, total_tests=total_tests))
     return False
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Build and test the JISP interpreter.")
     parser.add_argument("--fail-fast", action="store_false", help="Exit immediately when a single test fails.")
+    parser.add_argument("--no-cache", action="store_true", help="Re-run every check, ignoring memoized passes.")
     args = parser.parse_args()
 
-    if compile_go_program():
-        if run_all_checks(fail_fast=args.fail_fast):
+    # Load and parse the check suite while go build runs.
+    with ThreadPoolExecutor(max_workers=1) as preloader:
+        preloaded_checks = preloader.submit(_scan_and_load_checks)
+        compiled = compile_go_program()
+
+    if compiled:
+        if asyncio.run(run_all_checks(fail_fast=args.fail_fast, use_cache=not args.no_cache,
+                                      preloaded=preloaded_checks.result())):
             sys.exit(0)
         sys.exit(1)
     console.print(COMPILATION_FAILED)
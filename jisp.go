@@ -4,6 +4,7 @@
 package main
 
 import (
+	"bufio"
 	"bytes"
 	"encoding/json"
 	"errors"
@@ -2923,17 +2924,85 @@ const (
 	Cyan    = "\033[36m"
 )
 
+// runProgram executes a single unmarshaled JispProgram in place, wrapping any
+// non-Jisp execution error in a JispError for consistent output.
+func runProgram(jp *JispProgram) {
+	jp.ensureInitialized()
+
+	if err := jp.processImports(); err != nil {
+		jp.Error = jp.newError(&JispOperation{Name: "fatal"}, err.Error())
+		return
+	}
+
+	// Start execution only if there's no pre-existing error.
+	if jp.Error == nil {
+		err := jp.ExecuteFrame(jp.Code, []interface{}{"code"}, false, -1)
+		if err != nil && !errors.Is(err, ErrExit) {
+			// A non-JispError occurred during execution that wasn't handled.
+			// This would be a catastrophic interpreter bug.
+			// We wrap it in a JispError for consistent output.
+			jp.Error = jp.newError(&JispOperation{Name: "fatal"}, err.Error())
+		}
+	}
+}
+
+// runStream serves JISP programs over stdin/stdout as a request/response
+// pipeline: each request is one program object, each response is one final
+// program state on a single line. A driver (build.py) can launch the binary
+// once and push an entire check suite through it, paying process startup
+// and runtime init exactly once. Errors are reported through the "error"
+// field of the response state rather than the exit code.
+func runStream() {
+	dec := json.NewDecoder(os.Stdin)
+	out := bufio.NewWriter(os.Stdout)
+	enc := json.NewEncoder(out)
+
+	for {
+		var jp JispProgram
+		if err := dec.Decode(&jp); err != nil {
+			if errors.Is(err, io.EOF) {
+				return
+			}
+			log.Fatalf("Error decoding streamed JISP program: %v", err)
+		}
+
+		runProgram(&jp)
+
+		if err := enc.Encode(&jp); err != nil {
+			log.Fatalf("Error marshaling final state: %v", err)
+		}
+		if err := out.Flush(); err != nil {
+			log.Fatalf("Error writing final state: %v", err)
+		}
+	}
+}
+
 func main() {
 	log.SetFlags(0) // No timestamps
 
 	if len(os.Args) != 2 {
 		log.Fatalf("Usage: %s <jisp_file.json>", os.Args[0])
 	}
+	if os.Args[1] == "--stream" {
+		runStream()
+		return
+	}
 	filePath := os.Args[1]
 
-	fileContent, err := os.ReadFile(filePath)
-	if err != nil {
-		log.Fatalf("Error reading file: %v", err)
+	// "-" reads the program from stdin, so callers can pipe a program in
+	// without a temp-file round trip through the filesystem.
+	var fileContent []byte
+	var err error
+	if filePath == "-" {
+		fileContent, err = io.ReadAll(os.Stdin)
+		if err != nil {
+			log.Fatalf("Error reading stdin: %v", err)
+		}
+	} else {
+		fileContent, err = os.ReadFile(filePath)
+		if err != nil {
+			log.Fatalf("Error reading file: %v", err)
+		}
 	}
 
 	// This is the core change: unmarshal directly into a JispProgram.
@@ -2943,23 +3012,7 @@ func main() {
 		log.Fatalf("Error unmarshaling JISP program: %v", err)
 	}
 
-	// Initialize maps and slices if they are nil after unmarshaling
-	jp.ensureInitialized()
-
-	if err := jp.processImports(); err != nil {
-		log.Fatalf("Error processing imports: %v", err)
-	}
-
-	// Start execution only if there's no pre-existing error.
-	if jp.Error == nil {
-		err = jp.ExecuteFrame(jp.Code, []interface{}{"code"}, false, -1)
-		if err != nil && !errors.Is(err, ErrExit) {
-			// A non-JispError occurred during execution that wasn't handled.
-			// This would be a catastrophic interpreter bug.
-			// We wrap it in a JispError for consistent output.
-			jp.Error = jp.newError(&JispOperation{Name: "fatal"}, err.Error())
-		}
-	}
+	runProgram(&jp)
 
 	// Marshal the final state to JSON
 	output, err := json.MarshalIndent(&jp, "", "  ")